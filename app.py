@@ -1,8 +1,20 @@
 
+import asyncio
+import warnings
+
 import streamlit as st
-import requests
-from typing import Dict, Any
+import numpy as np
+import orjson
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from typing import TYPE_CHECKING, Dict, Any, List, Union
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+if TYPE_CHECKING:
+    import httpx
 
 
 # ===================== CONFIG =====================
@@ -14,7 +26,19 @@ st.set_page_config(
 
 API_URL = "https://app.backlinkscan.com/api/backlink-checker"
 
-HEADERS = {
+DATE_FORMAT = "%d-%m-%y"
+
+MAX_CONCURRENT_REQUESTS = 8
+
+HEADER_HTML = """
+<h1 style='text-align:center;'>🔗 Backlink Overview Checker</h1>
+<p style='text-align:center;color:gray;'>
+Analyze backlink health, authority & geographic distribution
+</p>
+"""
+
+# read-only: these are applied once to SESSION below
+HEADERS = MappingProxyType({
     "accept": "*/*",
     "accept-language": "en-US,en;q=0.9",
     "origin": "https://backlinkscan.com",
@@ -24,19 +48,73 @@ HEADERS = {
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/142.0.0.0 Safari/537.36"
     )
-}
+})
+
+# reuse keep-alive connections to the API and keep responses on disk,
+# so repeat lookups survive app restarts and are shared between users
+SESSION = CachedSession(
+    "backlink_cache",
+    backend="sqlite",
+    expire_after=3600,
+    allowable_codes=[200],
+    allowable_methods=["GET"]
+)
+SESSION.headers.update(HEADERS)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3)
+)
 
 
 # ===================== FUNCTIONS =====================
+@st.cache_data(ttl=3600, show_spinner=False)
 def fetch_backlink_data(domain: str) -> Dict[str, Any]:
-    response = requests.get(
+    response = SESSION.get(
         API_URL,
         params={"domain": domain},
-        headers=HEADERS,
         timeout=30
     )
     response.raise_for_status()
-    return response.json()
+    # parse the raw bytes directly, skipping the text decode of .json()
+    return orjson.loads(response.content)
+
+
+async def fetch_backlink_data_async(
+    client: "httpx.AsyncClient", domain: str
+) -> Dict[str, Any]:
+    response = await client.get(API_URL, params={"domain": domain})
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+async def _fetch_many(
+    domains: List[str]
+) -> List[Union[Dict[str, Any], Exception]]:
+    # imported here so single-domain page loads don't pay for httpx/h2
+    import httpx
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=dict(HEADERS),
+        timeout=30,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS)
+    ) as client:
+        async def fetch_one(domain: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await fetch_backlink_data_async(client, domain)
+
+        return await asyncio.gather(
+            *(fetch_one(d) for d in domains),
+            return_exceptions=True
+        )
+
+
+# analyze several domains concurrently over one HTTP/2 connection;
+# returns one item per domain, in order: the response dict or the error
+def fetch_many(domains: List[str]) -> List[Union[Dict[str, Any], Exception]]:
+    return asyncio.run(_fetch_many(domains))
 
 
 def extract_general_overview(api_response: Dict[str, Any]) -> Dict[str, Any]:
@@ -45,71 +123,108 @@ def extract_general_overview(api_response: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "domain": summary.get("target"),
         "rank": summary.get("rank"),
-        "backlinks": summary.get("backlinks"),
+        "backlinks": int(summary.get("backlinks") or 0),
         "backlinks_spam_score": summary.get("backlinks_spam_score"),
-        "broken_backlinks": summary.get("broken_backlinks"),
-        "broken_pages": summary.get("broken_pages"),
-        "crawled_pages": summary.get("crawled_pages"),
-        "external_links_count": summary.get("external_links_count"),
+        "broken_backlinks": int(summary.get("broken_backlinks") or 0),
+        "broken_pages": int(summary.get("broken_pages") or 0),
+        "crawled_pages": int(summary.get("crawled_pages") or 0),
+        "external_links_count": int(summary.get("external_links_count") or 0),
         "top_countries": api_response.get("top_countries", [])
     }
 
-def extract_latest_backlinks(api_response):
-    backlinks = api_response.get("latest_backlinks", [])
+# raw latest_backlinks rows, one column per API field the app uses
+def latest_backlinks_frame(api_response) -> pd.DataFrame:
+    return pd.DataFrame(
+        api_response.get("latest_backlinks") or [],
+        columns=[
+            "domain_from",
+            "url_from",
+            "dofollow",
+            "backlink_spam_score",
+            "first_seen"
+        ]
+    )
 
-    cleaned = []
-    for item in backlinks:
-        is_dofollow = item.get("dofollow", False)
 
-        cleaned.append({
-            "Source Domain": item.get("domain_from"),
-            "Url":item.get("url_from"),
-            "Link Type": "🟢 DoFollow " if is_dofollow else "🔴 NoFollow",
-            "Spam Score": item.get("backlink_spam_score"),
-            "First Seen": format_date_ddmmyy(item.get("first_seen"))
-        })
+# missing/NaN dofollow counts as NoFollow
+def dofollow_mask(df: pd.DataFrame) -> pd.Series:
+    return df["dofollow"].notna() & df["dofollow"].astype(bool)
 
-    return cleaned
+
+def extract_latest_backlinks(api_response):
+    if not api_response.get("latest_backlinks"):
+        return pd.DataFrame(
+            columns=["Source Domain", "Url", "Link Type", "Spam Score", "First Seen"]
+        ), 0, 0
+
+    df = latest_backlinks_frame(api_response)
+    is_dofollow = dofollow_mask(df)
+
+    cleaned = pd.DataFrame({
+        "Source Domain": df["domain_from"],
+        "Url": df["url_from"],
+        "Link Type": np.where(is_dofollow, "🟢 DoFollow ", "🔴 NoFollow"),
+        "Spam Score": df["backlink_spam_score"],
+        "First Seen": format_dates_ddmmyy(df["first_seen"])
+    })
+
+    dofollow_count = int(is_dofollow.sum())
+    nofollow_count = len(is_dofollow) - dofollow_count
+
+    return cleaned, dofollow_count, nofollow_count
 # look good dofollow vs nofollow
-def filter_backlinks_by_type(backlinks, dofollow=True):
-    return [b for b in backlinks if b.get("dofollow") == dofollow]
+# df is a latest_backlinks_frame(); same DoFollow rule as the counters
+def filter_backlinks_by_type(df: pd.DataFrame, dofollow=True) -> pd.DataFrame:
+    mask = dofollow_mask(df)
+    return df[mask == dofollow]
 
 
 #time conveter
+@lru_cache(maxsize=4096)
 def format_date_ddmmyy(date_str):
     if not date_str:
         return None
 
     try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        return dt.strftime("%d-%m-%y")
+        # fromisoformat accepts a trailing "Z" on Python 3.11+
+        dt = datetime.fromisoformat(date_str)
+        return dt.strftime(DATE_FORMAT)
     except Exception:
         return date_str
 
+
+# batch version of format_date_ddmmyy; each date keeps its own UTC offset
+def format_dates_ddmmyy(dates: pd.Series) -> pd.Series:
+    dates = dates.where(dates.astype(bool), None)
+
+    try:
+        with warnings.catch_warnings():
+            # pandas 2.x warns (3.x raises) on mixed offsets
+            warnings.simplefilter("ignore", FutureWarning)
+            parsed = pd.to_datetime(dates, format="ISO8601", errors="coerce")
+    except ValueError:
+        parsed = None
+
+    if parsed is None or not pd.api.types.is_datetime64_any_dtype(parsed):
+        return dates.map(format_date_ddmmyy)
+
+    return parsed.dt.strftime(DATE_FORMAT).fillna(dates)
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
 def add_country_percentages(top_countries):
-    total = sum(item["count"] for item in top_countries)
+    df = pd.DataFrame(top_countries, columns=["country", "count"])
+    total = df["count"].sum()
     if total == 0:
-        return []
+        return pd.DataFrame(columns=["Country", "Percentage (%)"])
 
-    return [
-        {
-            "Country": item["country"],
-            "Percentage (%)": round((item["count"] / total) * 100, 2)
-        }
-        for item in top_countries
-    ]
+    df["Percentage (%)"] = (df["count"] / total * 100).round(2)
+    return df[["country", "Percentage (%)"]].rename(
+        columns={"country": "Country"}
+    )
 
 
 # ===================== HEADER =====================
-st.markdown(
-    """
-    <h1 style='text-align:center;'>🔗 Backlink Overview Checker</h1>
-    <p style='text-align:center;color:gray;'>
-    Analyze backlink health, authority & geographic distribution
-    </p>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 st.divider()
 
@@ -158,24 +273,24 @@ if run_check:
                 # ===================== COUNTRIES SECTION =====================
                 st.subheader("🌍 Top Referring Countries")
 
-                countries_data = add_country_percentages(
+                countries_df = add_country_percentages(
                     overview["top_countries"]
                 )
 
-                if countries_data:
+                if not countries_df.empty:
                     st.dataframe(
-                        countries_data,
+                        countries_df,
+                        column_config={
+                            "Percentage (%)": st.column_config.ProgressColumn(
+                                "Distribution",
+                                min_value=0,
+                                max_value=100,
+                                format="%.2f%%"
+                            )
+                        },
                         use_container_width=True,
                         hide_index=True
                     )
-
-                    st.markdown("#### Distribution")
-                    for item in countries_data:
-                        st.write(
-                            f"**{item['Country']}** — {item['Percentage (%)']}%"
-                        )
-                        st.progress(item["Percentage (%)"] / 100)
-
                 else:
                     st.info("No country distribution data available.")
 
@@ -184,20 +299,15 @@ if run_check:
         st.divider()
         st.subheader("🔗 Latest Backlinks")
 
-        latest_backlinks = extract_latest_backlinks(data)
-        nofollow_count = len(
-            [b for b in data.get("latest_backlinks", []) if not b.get("dofollow")]
-        )
-
-        dofollow_count = len(
-            [b for b in data.get("latest_backlinks", []) if b.get("dofollow")]
+        latest_backlinks, dofollow_count, nofollow_count = (
+            extract_latest_backlinks(data)
         )
 
         c1, c2 = st.columns(2)
         c1.metric("🟢 DoFollow Links", dofollow_count)
         c2.metric("🔴 NoFollow Links", nofollow_count)
 
-        if latest_backlinks:
+        if not latest_backlinks.empty:
             st.dataframe(
                 latest_backlinks,
                 use_container_width=True,